@@ -1,9 +1,11 @@
 from .mysql_inserter import MySQLDatabaseInserter
 from .postgres_inserter import PostgreSQLDatabaseInserter
 from .googlesheet_inserter import GoogleSheetsInserter
+from .query_handler import dispose_engines
 
 __all__ = [
     "MySQLDatabaseInserter",
     "PostgreSQLDatabaseInserter",
-    "GoogleSheetsInserter"
+    "GoogleSheetsInserter",
+    "dispose_engines"
 ]
@@ -0,0 +1,153 @@
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class BaseDatabaseInserter:
+    """
+    Base class for handling DataFrame insertion into a database.
+    """
+
+    def __init__(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
+        """
+        Initializes the database handler with connection parameters.
+
+        Args:
+            db_user (str): The username for the database.
+            db_password (str): The password for the database.
+            db_host (str): The host address of the database.
+            db_port (str): The port number on which the database is running.
+            db_name (str): The name of the database.
+        """
+        self._known_tables = set()
+        self.db_handler = self.create_db_handler(db_user, db_password, db_host, db_port, db_name)
+
+    def __enter__(self):
+        """
+        Enters the runtime context, returning the inserter itself.
+
+        Returns:
+            BaseDatabaseInserter: The inserter instance.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the runtime context and releases the database handler.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases the database handler.
+
+        Connection pools are cached per connection URL and shared between inserters, so
+        they stay warm after this call; use `dispose_engines` to close them.
+        """
+        self.db_handler.close_connection()
+
+    def create_db_handler(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
+        """
+        Creates a database handler. This method should be implemented in subclasses to 
+        handle different databases (e.g., MySQL, PostgreSQL).
+
+        Args:
+            db_user (str): The username for the database.
+            db_password (str): The password for the database.
+            db_host (str): The host address of the database.
+            db_port (str): The port number on which the database is running.
+            db_name (str): The name of the database.
+
+        Returns:
+            SQLDatabaseHandler: Database handler object.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def insert_df(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Inserts a Pandas DataFrame into the specified database table.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the database.
+
+        Raises:
+            Exception: If the DataFrame insertion fails due to database connectivity or query issues.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def _ensure_table(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Creates the target table from the DataFrame schema if it does not exist yet.
+
+        The check goes through pandas/SQLAlchemy only the first time a table is seen by
+        this inserter; later inserts into the same table skip it.
+
+        Args:
+            df (pd.DataFrame): The DataFrame whose schema defines the table.
+            table_name (str): The name of the target table in the database.
+        """
+        if table_name not in self._known_tables:
+            df.head(0).to_sql(name=table_name, con=self.db_handler.engine, if_exists='append', index=False)
+            self._known_tables.add(table_name)
+
+    def _insert_chunk(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Inserts a DataFrame into an existing table using the fastest available path,
+        without printing or handling errors. This method should be implemented in subclasses.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the database.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def insert_df_parallel(self, df: pd.DataFrame, table_name: str, workers: int = 4) -> list[tuple[int, int]]:
+        """
+        Inserts a Pandas DataFrame by splitting it into `workers` partitions that are loaded
+        concurrently.
+
+        Each partition is loaded and committed in its own transaction, so unlike `insert_df`
+        this is not all-or-nothing: if one partition fails, the others stay committed. The row
+        ranges that were not inserted are printed and returned so they can be retried.
+
+        Partitions use their own connection: a pooled one from the engine (5 connections plus
+        10 overflow, so more than 15 workers will queue for a connection), or a new unpooled
+        connection per partition on the PostgreSQL ADBC path.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the database.
+            workers (int): Number of partitions and worker threads. Defaults to 4.
+
+        Returns:
+            list[tuple[int, int]]: The (start, stop) positional row ranges of the partitions that
+                failed to insert, e.g. `df.iloc[start:stop]`. Empty if every partition succeeded.
+        """
+        try:
+            # Create the table once up front so the workers don't race to create it
+            self._ensure_table(df, table_name)
+        except Exception as e:
+            # Handle any exceptions that occur during the insertion process
+            print(f"Failed to insert data: {e}")
+            return [(0, len(df))]
+
+        size = max(1, -(-len(df) // workers))
+        failed = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._insert_chunk, df.iloc[start:start + size], table_name): (start, min(start + size, len(df)))
+                for start in range(0, len(df), size)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append(futures[future])
+                    start, stop = futures[future]
+                    print(f"Failed to insert rows {start}:{stop} into {table_name}: {e}")
+
+        if failed:
+            print(f"Data partially inserted into {table_name}: {len(failed)} of {len(futures)} partitions failed")
+        else:
+            print(f"Data successfully inserted into {table_name}")
+        return sorted(failed)
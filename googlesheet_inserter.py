@@ -1,7 +1,29 @@
+import random
+import time
+from functools import lru_cache
 import pandas as pd
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from google.oauth2 import service_account
 
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 6
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+
+@lru_cache(maxsize=None)
+def _load_credentials(service_account_file: str) -> service_account.Credentials:
+    """
+    Loads the service account credentials, caching them per service account file.
+
+    Args:
+        service_account_file (str): Path to the Google Cloud service account file (JSON format).
+
+    Returns:
+        Credentials: The service account credentials.
+    """
+    return service_account.Credentials.from_service_account_file(service_account_file, scopes=SCOPES)
+
 
 class BaseGoogleSheetsHandler:
     """
@@ -19,7 +41,9 @@ class BaseGoogleSheetsHandler:
 
     def build_service(self, service_account_file: str):
         """
-        Builds the Google Sheets API service.
+        Builds the Google Sheets API service. Credentials are shared by all handlers created
+        with the same service account file, but each handler gets its own service, since the
+        underlying HTTP connection is not thread-safe.
 
         Args:
             service_account_file (str): Path to the Google Cloud service account file (JSON format).
@@ -27,9 +51,30 @@ class BaseGoogleSheetsHandler:
         Returns:
             service: Google Sheets API service object.
         """
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-        creds = service_account.Credentials.from_service_account_file(service_account_file, scopes=SCOPES)
-        return build('sheets', 'v4', credentials=creds)
+        creds = _load_credentials(service_account_file)
+        return build('sheets', 'v4', credentials=creds, cache_discovery=False)
+
+    def _with_retry(self, request):
+        """
+        Executes a Google Sheets API request, retrying with exponential backoff and jitter
+        when it fails with a rate-limit (429) or transient server (5xx) error.
+
+        Args:
+            request: The Google API request object to execute.
+
+        Returns:
+            dict: The response of the request.
+
+        Raises:
+            HttpError: If the request fails with a non-retryable error or retries are exhausted.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return request.execute()
+            except HttpError as e:
+                if e.resp.status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                    raise
+                time.sleep(min(64, 2 ** attempt) + random.random())
 
     def execute_query(self, spreadsheet_id: str, range_name: str):
         """
@@ -43,7 +88,8 @@ class BaseGoogleSheetsHandler:
             dict: The data retrieved from the Google Sheet.
         """
         sheet = self.service.spreadsheets()
-        result = sheet.values().get(spreadsheetId=spreadsheet_id, range=range_name).execute()
+        result = self._with_retry(sheet.values().get(spreadsheetId=spreadsheet_id, range=range_name,
+                                                     majorDimension="ROWS", fields="values"))
         return result.get('values', [])
 
 
@@ -61,10 +107,31 @@ class GoogleSheetsInserter(BaseGoogleSheetsHandler):
         """
         super().__init__(service_account_file)
 
+    def _to_values(self, df: pd.DataFrame) -> list[list]:
+        """
+        Converts a DataFrame into a JSON-serializable list of rows for the Google Sheets API.
+
+        The frame is cast to object dtype in a single pass, datetime and timedelta columns are
+        formatted as strings and missing values (NaN/NaT) are replaced by None, which Sheets accepts.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be converted.
+
+        Returns:
+            list[list]: The DataFrame's rows as lists of Python values.
+        """
+        values = df.astype(object)
+        for column in df.select_dtypes(include=['datetime', 'datetimetz']).columns:
+            values[column] = df[column].dt.strftime('%Y-%m-%d %H:%M:%S').astype(object)
+        for column in df.select_dtypes(include=['timedelta']).columns:
+            values[column] = df[column].astype(str).astype(object)
+        # Mask on the original frame: the string conversions may render missing values as NaN or 'NaT'
+        return values.where(df.notna(), None).to_numpy().tolist()
+
     def insert_df_to_google_sheet(self, df: pd.DataFrame, spreadsheet_id: str, sheetname: str,
-                                  start_column: str, end_column: str) -> None:
+                                  start_column: str, end_column: str, chunksize: int = 10000) -> None:
         """
-        Inserts a Pandas DataFrame into a Google Sheet at the specified range.
+        Appends a Pandas DataFrame after the existing rows of the specified range in a Google Sheet.
 
         Args:
             df (pd.DataFrame): The DataFrame to be inserted into the Google Sheet.
@@ -72,6 +139,8 @@ class GoogleSheetsInserter(BaseGoogleSheetsHandler):
             sheetname (str): The name of the sheet within the spreadsheet to insert data into.
             start_column (str): The starting column in the range where data will be inserted.
             end_column (str): The ending column in the range where data will be inserted.
+            chunksize (int): Number of rows sent per append request, bounding the memory used to
+                build each request body. Defaults to 10,000.
 
         Returns:
             None: Inserts the DataFrame into the specified Google Sheet.
@@ -80,17 +149,49 @@ class GoogleSheetsInserter(BaseGoogleSheetsHandler):
             Exception: If the Google Sheets API call fails or the data insertion fails.
         """
         try:
-            # Fetch the current values from the specified sheet and range
-            values = self.execute_query(spreadsheet_id, sheetname + "!" + start_column + ":" + end_column)
+            # Append the DataFrame's values after the last row of the table in the given range,
+            # one chunk per request; the next free row is found server-side so no prior read is needed
+            sheet = self.service.spreadsheets()
+            for start in range(0, len(df), chunksize):
+                self._with_retry(sheet.values().append(
+                    spreadsheetId=spreadsheet_id,
+                    range=f"{sheetname}!{start_column}:{end_column}",
+                    valueInputOption="RAW",
+                    insertDataOption="INSERT_ROWS",
+                    includeValuesInResponse=False,
+                    fields="updates(updatedRows)",
+                    body={"values": self._to_values(df.iloc[start:start + chunksize])}
+                ))
+
+            print("Data successfully inserted into Google Sheet")
+        except Exception as e:
+            print(f"Failed to insert data: {e}")
+
+    def insert_many(self, frames: list[tuple[pd.DataFrame, str]], spreadsheet_id: str) -> None:
+        """
+        Writes several DataFrames to their own ranges of a Google Sheet in a single request.
+
+        Args:
+            frames (list[tuple[pd.DataFrame, str]]): Pairs of a DataFrame and the A1 range to write it to
+                (e.g. "Sheet1!A1").
+            spreadsheet_id (str): The ID of the target Google Spreadsheet.
+
+        Returns:
+            None: Writes the DataFrames into the specified ranges.
 
-            # Append the DataFrame's values to the Google Sheet
+        Raises:
+            Exception: If the Google Sheets API call fails or the data insertion fails.
+        """
+        try:
             sheet = self.service.spreadsheets()
-            sheet.values().update(
+            self._with_retry(sheet.values().batchUpdate(
                 spreadsheetId=spreadsheet_id,
-                range=sheetname + "!A" + str(len(values) + 1),
-                valueInputOption="RAW",
-                body={"values": df.values.tolist()}
-            ).execute()
+                fields="totalUpdatedRows",
+                body={
+                    "valueInputOption": "RAW",
+                    "data": [{"range": range_name, "values": self._to_values(df)} for df, range_name in frames]
+                }
+            ))
 
             print("Data successfully inserted into Google Sheet")
         except Exception as e:
@@ -1,98 +1,205 @@
+import csv
+import os
+import tempfile
 import pandas as pd
+from .base_inserter import BaseDatabaseInserter
 from .query_handler import SQLDatabaseHandler
 
 
-class BaseDatabaseInserter:
+def _escape_backslashes(value):
     """
-    Base class for handling DataFrame insertion into a database.
+    Doubles the backslashes in a string value, leaving any other value unchanged.
+
+    Args:
+        value: A cell value from the DataFrame.
+
+    Returns:
+        The escaped string, or the value as it was if it is not a string.
     """
+    return value.replace('\\', '\\\\') if isinstance(value, str) else value
 
-    def __init__(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
-        """
-        Initializes the database handler with connection parameters.
 
-        Args:
-            db_user (str): The username for the database.
-            db_password (str): The password for the database.
-            db_host (str): The host address of the database.
-            db_port (str): The port number on which the database is running.
-            db_name (str): The name of the database.
-        """
-        self.db_handler = self.create_db_handler(db_user, db_password, db_host, db_port, db_name)
+class MySQLDatabaseInserter(BaseDatabaseInserter):
+    """
+    Class for inserting a Pandas DataFrame into a MySQL database.
+    """
 
     def create_db_handler(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
         """
-        Creates a database handler. This method should be implemented in subclasses to 
-        handle different databases (e.g., MySQL, PostgreSQL).
+        Creates a MySQL database handler.
 
         Args:
-            db_user (str): The username for the database.
-            db_password (str): The password for the database.
-            db_host (str): The host address of the database.
-            db_port (str): The port number on which the database is running.
-            db_name (str): The name of the database.
+            db_user (str): The username for the MySQL database.
+            db_password (str): The password for the MySQL database.
+            db_host (str): The host address of the MySQL database.
+            db_port (str): The port number on which the MySQL database is running.
+            db_name (str): The name of the MySQL database.
 
         Returns:
-            SQLDatabaseHandler: Database handler object.
+            SQLDatabaseHandler: A MySQL database handler object.
         """
-        raise NotImplementedError("Subclasses must implement this method.")
+        return SQLDatabaseHandler(user=db_user, password=db_password, host=db_host, port=db_port, database=db_name)
 
-    def insert_df(self, df: pd.DataFrame, table_name: str) -> None:
+    def _load_data(self, cur, df: pd.DataFrame, table_name: str) -> None:
         """
-        Inserts a Pandas DataFrame into the specified database table.
+        Runs LOAD DATA LOCAL INFILE for a DataFrame on the given cursor, without committing.
+
+        The DataFrame is written to a temporary CSV file which MySQL ingests in a
+        single server-side bulk operation. Non-numeric values are quoted and missing
+        values are written as \\N, so LOAD DATA reads them as SQL NULL while strings such
+        as "NULL" or "" are kept as they are.
+
+        With LOCAL, MySQL skips or truncates rows it cannot load (e.g. duplicate keys or
+        values that do not fit the column) and only reports warnings; these are raised
+        as an error so the surrounding transaction is rolled back.
 
         Args:
+            cur: PyMySQL cursor to run the statement on.
             df (pd.DataFrame): The DataFrame to be inserted.
-            table_name (str): The name of the target table in the database.
+            table_name (str): The name of the target table in the MySQL database.
 
         Raises:
-            Exception: If the DataFrame insertion fails due to database connectivity or query issues.
+            RuntimeError: If MySQL reports warnings for the loaded data.
         """
-        raise NotImplementedError("Subclasses must implement this method.")
+        df = df.copy(deep=False)
+        # Booleans are loaded into TINYINT columns, which expect 0/1 rather than True/False
+        for column in df.select_dtypes(include=['bool', 'boolean']).columns:
+            df[column] = df[column].astype('Int8')
+        # Backslash is LOAD DATA's escape character, so literal backslashes are doubled
+        # (per cell, so object columns of dates or Decimals and duplicate index labels are fine)
+        for column in df.select_dtypes(include=['object', 'string']).columns:
+            df[column] = df[column].map(_escape_backslashes)
+
+        tmp = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', newline='', encoding='utf-8', delete=False)
+        try:
+            with tmp:
+                df.to_csv(tmp, index=False, header=False, na_rep='\\N', lineterminator='\n',
+                          quoting=csv.QUOTE_NONNUMERIC)
+
+            path = tmp.name.replace('\\', '/')
+            columns = ', '.join(f'`{c}`' for c in df.columns)
+            cur.execute(
+                f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE `{table_name}` CHARACTER SET utf8mb4 "
+                f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                f"LINES TERMINATED BY '\\n' ({columns})"
+            )
+        finally:
+            os.remove(tmp.name)
 
+        cur.execute("SHOW WARNINGS")
+        warnings = [row for row in cur.fetchall() if row[0] != 'Note']
+        if warnings:
+            raise RuntimeError(
+                f"LOAD DATA into {table_name} reported {len(warnings)} warning(s); first: {warnings[0][2]}"
+            )
 
-class MySQLDatabaseInserter(BaseDatabaseInserter):
-    """
-    Class for inserting a Pandas DataFrame into a MySQL database.
-    """
+    def _mysql_bulk_load(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Helper function to perform bulk insert into MySQL using LOAD DATA LOCAL INFILE.
 
-    def create_db_handler(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the MySQL database.
+
+        Returns:
+            None: This function writes data directly to the MySQL database.
         """
-        Creates a MySQL database handler.
+        with self.db_handler.engine.begin() as conn:
+            with conn.connection.cursor() as cur:
+                self._load_data(cur, df, table_name)
+
+    def _multi_row_chunksize(self, df: pd.DataFrame) -> int:
+        """
+        Computes the number of rows per multi-row INSERT: 10,000 rows, capped so a single
+        statement stays under MySQL's 65,535 placeholder limit.
 
         Args:
-            db_user (str): The username for the MySQL database.
-            db_password (str): The password for the MySQL database.
-            db_host (str): The host address of the MySQL database.
-            db_port (str): The port number on which the MySQL database is running.
-            db_name (str): The name of the MySQL database.
+            df (pd.DataFrame): The DataFrame to be inserted.
 
         Returns:
-            SQLDatabaseHandler: A MySQL database handler object.
+            int: The chunk size to pass to `to_sql`.
         """
-        return SQLDatabaseHandler(user=db_user, password=db_password, host=db_host, port=db_port, database=db_name)
+        return max(1, min(10000, 65535 // max(1, len(df.columns))))
+
+    def _insert_chunk(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Bulk loads a DataFrame into an existing MySQL table with LOAD DATA LOCAL INFILE.
 
-    def insert_df(self, df: pd.DataFrame, table_name: str) -> None:
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the MySQL database.
+        """
+        self._mysql_bulk_load(df, table_name)
+
+    def insert_df(self, df: pd.DataFrame, table_name: str, use_load_data: bool = True,
+                  chunksize: int = None) -> None:
         """
         Inserts a Pandas DataFrame into a MySQL database table.
 
+        By default the data is bulk loaded with LOAD DATA LOCAL INFILE. When that is not
+        available (e.g. local_infile is disabled on the server), pass `use_load_data=False`
+        to fall back to multi-row INSERT statements sent in chunks.
+
         Args:
             df (pd.DataFrame): The DataFrame to be inserted.
             table_name (str): The name of the target table in the MySQL database.
+            use_load_data (bool): Whether to use LOAD DATA LOCAL INFILE. Defaults to True.
+            chunksize (int): Number of rows per multi-row INSERT when `use_load_data` is False.
+                Defaults to 10,000 rows, capped to stay under MySQL's 65,535 placeholder limit.
 
         Raises:
             Exception: If the DataFrame insertion fails due to database connectivity or query issues.
         """
         try:
-            # Insert the DataFrame into the specified MySQL table
-            df.to_sql(name=table_name, con=self.db_handler.engine, if_exists='append', index=False)
+            if use_load_data:
+                # Create the table from the DataFrame schema if it does not exist yet
+                self._ensure_table(df, table_name)
+
+                # Bulk load the DataFrame into the specified MySQL table
+                self._mysql_bulk_load(df, table_name)
+            else:
+                if chunksize is None:
+                    chunksize = self._multi_row_chunksize(df)
+
+                # Insert the DataFrame into the specified MySQL table with multi-row INSERTs
+                df.to_sql(name=table_name, con=self.db_handler.engine, if_exists='append', index=False,
+                          method='multi', chunksize=chunksize)
             print(f"Data successfully inserted into {table_name}")
         except Exception as e:
             # Handle any exceptions that occur during the insertion process
             print(f"Failed to insert data: {e}")
-        finally:
-            # Close the MySQL connection
-            self.db_handler.close_connection()
+
+    def insert_many(self, frames: dict[str, pd.DataFrame], use_load_data: bool = True) -> None:
+        """
+        Inserts several DataFrames into their MySQL tables within a single transaction,
+        so all of the rows are committed (or rolled back) together.
+
+        Missing tables are created beforehand; MySQL commits DDL implicitly, so they are
+        kept even if the load is rolled back.
+
+        Args:
+            frames (dict[str, pd.DataFrame]): Mapping of target table names to the DataFrames to insert.
+            use_load_data (bool): Whether to use LOAD DATA LOCAL INFILE rather than multi-row
+                INSERT statements. Defaults to True.
+
+        Raises:
+            Exception: If the DataFrame insertion fails due to database connectivity or query issues.
+        """
+        try:
+            for table_name, df in frames.items():
+                self._ensure_table(df, table_name)
+
+            with self.db_handler.engine.begin() as conn, conn.connection.cursor() as cur:
+                for table_name, df in frames.items():
+                    if use_load_data:
+                        self._load_data(cur, df, table_name)
+                    else:
+                        df.to_sql(name=table_name, con=conn, if_exists='append', index=False,
+                                  method='multi', chunksize=self._multi_row_chunksize(df))
+            print(f"Data successfully inserted into {', '.join(frames)}")
+        except Exception as e:
+            # Handle any exceptions that occur during the insertion process
+            print(f"Failed to insert data: {e}")
 
 
 # Usage Example (to be removed when packaging):
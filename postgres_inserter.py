@@ -1,55 +1,114 @@
 import pandas as pd
+from .base_inserter import BaseDatabaseInserter
 from .query_handler import PostgreSQLDatabaseHandler
 from io import StringIO
+from decimal import Decimal
 import csv
 
-class BaseDatabaseInserter:
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
+try:
+    from adbc_driver_postgresql import dbapi as adbc_dbapi
+except ImportError:
+    adbc_dbapi = None
+
+
+def _float_to_decimal(value):
+    """
+    Converts a float to Decimal for binary COPY into a numeric column.
+
+    Args:
+        value: A non-null value from the DataFrame.
+
+    Returns:
+        The value as a Decimal if it is a float, otherwise the value unchanged.
     """
-    Base class for handling DataFrame insertion into a database.
+    return Decimal(repr(value)) if isinstance(value, float) else value
+
+
+def _float_to_int(value):
     """
+    Converts a whole-number float to int for binary COPY into an integer column.
 
-    def __init__(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
+    Args:
+        value: A non-null value from the DataFrame.
+
+    Returns:
+        The value as an int if it is a whole-number float, otherwise the value unchanged.
+    """
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+
+# Binary COPY packs each value with the dumper of the target column's type, which only accepts
+# matching Python types; these convert the values pandas produces for common dtype mismatches
+BINARY_COPY_CONVERTERS = {
+    'numeric': _float_to_decimal,
+    'int2': _float_to_int,
+    'int4': _float_to_int,
+    'int8': _float_to_int,
+}
+
+
+class CSVRowStream:
+    """
+    File-like object that lazily CSV-encodes rows from an iterator, so COPY can
+    stream them to the server without buffering the whole chunk in memory.
+    """
+
+    def __init__(self, rows, buffer_size: int = 65536):
         """
-        Initializes the database handler with connection parameters.
+        Initializes the stream over the given rows.
 
         Args:
-            db_user (str): The username for the database.
-            db_password (str): The password for the database.
-            db_host (str): The host address of the database.
-            db_port (str): The port number on which the database is running.
-            db_name (str): The name of the database.
+            rows: Iterable of row tuples to be encoded as CSV.
+            buffer_size (int): Approximate number of characters encoded per refill.
         """
-        self.db_handler = self.create_db_handler(db_user, db_password, db_host, db_port, db_name)
+        self.rows = iter(rows)
+        self.buffer_size = buffer_size
+        self._text = StringIO()
+        self._writer = csv.writer(self._text)
+        self._buffer = bytearray()
 
-    def create_db_handler(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
+    def _encode_next(self) -> bytes:
         """
-        Creates a database handler. This method should be implemented in subclasses to 
-        handle different databases (e.g., PostgreSQL, MySQL).
-
-        Args:
-            db_user (str): The username for the database.
-            db_password (str): The password for the database.
-            db_host (str): The host address of the database.
-            db_port (str): The port number on which the database is running.
-            db_name (str): The name of the database.
+        Encodes the next batch of rows (roughly `buffer_size` characters).
 
         Returns:
-            PostgreSQLDatabaseHandler: Database handler object for PostgreSQL.
+            bytes: The UTF-8 encoded CSV lines, or empty bytes once the rows are exhausted.
         """
-        raise NotImplementedError("Subclasses must implement this method.")
+        self._text.seek(0)
+        self._text.truncate()
+        for row in self.rows:
+            self._writer.writerow(row)
+            if self._text.tell() >= self.buffer_size:
+                break
+        return self._text.getvalue().encode('utf-8')
 
-    def insert_df(self, df: pd.DataFrame, table_name: str) -> None:
+    def read(self, size: int = -1) -> bytes:
         """
-        Inserts a Pandas DataFrame into the specified database table.
+        Reads up to `size` bytes of CSV data, encoding more rows as needed.
 
         Args:
-            df (pd.DataFrame): The DataFrame to be inserted.
-            table_name (str): The name of the target table in the database.
+            size (int): Maximum number of bytes to return. A negative value reads everything.
 
-        Raises:
-            Exception: If the DataFrame insertion fails due to database connectivity or query issues.
+        Returns:
+            bytes: The next block of CSV data, or empty bytes at end of stream.
         """
-        raise NotImplementedError("Subclasses must implement this method.")
+        while size < 0 or len(self._buffer) < size:
+            block = self._encode_next()
+            if not block:
+                break
+            self._buffer += block
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
 
 
 class PostgreSQLDatabaseInserter(BaseDatabaseInserter):
@@ -57,6 +116,33 @@ class PostgreSQLDatabaseInserter(BaseDatabaseInserter):
     Class for inserting a Pandas DataFrame into a PostgreSQL database.
     """
 
+    def __init__(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str,
+                 use_binary_copy: bool = False, use_adbc: bool = False):
+        """
+        Initializes the PostgreSQL inserter with connection parameters.
+
+        Args:
+            db_user (str): The username for the PostgreSQL database.
+            db_password (str): The password for the PostgreSQL database.
+            db_host (str): The host address of the PostgreSQL database.
+            db_port (str): The port number on which the PostgreSQL database is running.
+            db_name (str): The name of the PostgreSQL database.
+            use_binary_copy (bool): Whether to connect with psycopg3 and load data with binary COPY,
+                which skips text encoding of numeric and timestamp values. Requires the `psycopg` package.
+                Defaults to False (psycopg2 and CSV COPY).
+            use_adbc (bool): Whether `insert_df` should ingest large DataFrames through `insert_df_arrow`
+                (ADBC and Apache Arrow). Requires the `pyarrow` and `adbc-driver-postgresql` packages.
+                Defaults to False.
+
+        Raises:
+            ValueError: If both `use_binary_copy` and `use_adbc` are requested.
+        """
+        if use_binary_copy and use_adbc:
+            raise ValueError("use_binary_copy and use_adbc cannot be combined.")
+        self.use_binary_copy = use_binary_copy
+        self.use_adbc = use_adbc
+        super().__init__(db_user, db_password, db_host, db_port, db_name)
+
     def create_db_handler(self, db_user: str, db_password: str, db_host: str, db_port: str, db_name: str):
         """
         Creates a PostgreSQL database handler.
@@ -71,7 +157,9 @@ class PostgreSQLDatabaseInserter(BaseDatabaseInserter):
         Returns:
             PostgreSQLDatabaseHandler: A PostgreSQL database handler object.
         """
-        return PostgreSQLDatabaseHandler(user=db_user, password=db_password, host=db_host, port=db_port, database=db_name)
+        driver = 'psycopg' if self.use_binary_copy else 'psycopg2'
+        return PostgreSQLDatabaseHandler(user=db_user, password=db_password, host=db_host, port=db_port,
+                                         database=db_name, driver=driver)
 
     def psql_insert_copy(self, table, conn, keys, data_iter) -> None:
         """
@@ -88,35 +176,253 @@ class PostgreSQLDatabaseInserter(BaseDatabaseInserter):
         """
         dbapi_conn = conn.connection
         with dbapi_conn.cursor() as cur:
-            s_buf = StringIO()
-            writer = csv.writer(s_buf)
-            writer.writerows(data_iter)
-            s_buf.seek(0)
             columns = ', '.join(f'"{k}"' for k in keys)
             sql = f'COPY {table.name} ({columns}) FROM STDIN WITH CSV'
-            cur.copy_expert(sql=sql, file=s_buf)
+            # Rows are encoded lazily as psycopg2 reads from the stream
+            cur.copy_expert(sql=sql, file=CSVRowStream(data_iter))
+
+    def psql_insert_copy_binary(self, table, conn, keys, data_iter) -> None:
+        """
+        Helper function to perform bulk insert into PostgreSQL using binary COPY (psycopg3).
+
+        The target column types are looked up once per call so each value is packed
+        with the binary format the server expects. Floats are converted to Decimal for
+        `numeric` columns and whole-number floats (integer columns holding NaN) to int for
+        integer columns. Other values must already match the column's type: int/float for
+        integer and floating point columns, str for text columns, bool for `boolean`,
+        date/datetime for date and timestamp columns (tz-aware for `timestamptz`).
+
+        Args:
+            table: SQLAlchemy Table object representing the target table.
+            conn: SQLAlchemy Connection object.
+            keys: List of column names to be inserted.
+            data_iter: Iterator over the data to be inserted.
+
+        Returns:
+            None: This function writes data directly to the PostgreSQL database.
+        """
+        dbapi_conn = conn.connection
+        with dbapi_conn.cursor() as cur:
+            cur.execute(
+                "SELECT a.attname, a.atttypid, t.typname FROM pg_attribute a "
+                "JOIN pg_type t ON t.oid = a.atttypid "
+                "WHERE a.attrelid = %s::regclass AND a.attnum > 0 AND NOT a.attisdropped",
+                (table.name,)
+            )
+            column_types = {name: (oid, type_name) for name, oid, type_name in cur.fetchall()}
+            converters = [BINARY_COPY_CONVERTERS.get(column_types[k][1]) for k in keys]
+            columns = ', '.join(f'"{k}"' for k in keys)
+            sql = f'COPY {table.name} ({columns}) FROM STDIN WITH (FORMAT BINARY)'
+            with cur.copy(sql) as copy:
+                copy.set_types([column_types[k][0] for k in keys])
+                if not any(converters):
+                    for row in data_iter:
+                        copy.write_row(row)
+                else:
+                    for row in data_iter:
+                        copy.write_row([
+                            value if convert is None or value is None else convert(value)
+                            for value, convert in zip(row, converters)
+                        ])
+
+    def _arrow_csv(self, df: pd.DataFrame):
+        """
+        Serializes a DataFrame to CSV with pyarrow's vectorized writer, which releases the GIL.
+
+        Only plain scalar types whose CSV rendering PostgreSQL reads back unchanged (integers,
+        floats, booleans, strings, decimals, dates and timestamps) are encoded this way. Durations
+        are written as raw integers and nested or extension types (e.g. UUID) are not supported
+        by the writer, so DataFrames containing them are left to the `to_csv` fallback.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be serialized.
+
+        Returns:
+            pa.BufferReader: A file-like object over the CSV data, or None if pyarrow is not
+                installed or cannot faithfully encode the DataFrame's column types.
+        """
+        if pa_csv is None:
+            return None
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if not all(
+                pa.types.is_integer(t) or pa.types.is_floating(t) or pa.types.is_boolean(t)
+                or pa.types.is_string(t) or pa.types.is_large_string(t) or pa.types.is_decimal(t)
+                or pa.types.is_date(t) or pa.types.is_timestamp(t) or pa.types.is_null(t)
+                for t in table.schema.types
+            ):
+                return None
+            sink = pa.BufferOutputStream()
+            pa_csv.write_csv(table, sink, write_options=pa_csv.WriteOptions(include_header=False))
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+        return pa.BufferReader(sink.getvalue())
 
-    def insert_df(self, df: pd.DataFrame, table_name: str) -> None:
+    def _copy_df(self, cur, df: pd.DataFrame, table_name: str, chunksize: int = 50000) -> None:
+        """
+        Writes a DataFrame to a PostgreSQL table with CSV COPY on the given cursor.
+
+        Each chunk is serialized in C without building Python row tuples, so memory stays
+        bounded by `chunksize`: with pyarrow when it is installed and supports the column
+        types (outside the GIL, so encoding overlaps with network I/O in `insert_df_parallel`),
+        otherwise with pandas' CSV writer into a reused buffer.
+
+        Both encoders load missing values (NaN/None/NaT) as NULL and keep empty strings as
+        empty strings. The `to_csv` fallback marks NULLs as `\\N`, so a string value that is
+        literally `\\N` is also read as NULL on that path.
+
+        Args:
+            cur: psycopg2 cursor to run COPY on.
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the PostgreSQL database.
+            chunksize (int): Number of rows sent per COPY. Defaults to 50,000.
+        """
+        columns = ', '.join(f'"{c}"' for c in df.columns)
+        # pyarrow quotes every string, so only its unquoted empty fields are NULLs
+        arrow_sql = f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)'
+        # pandas writes empty strings and missing values alike unless NULLs get their own marker
+        pandas_sql = f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        s_buf = StringIO()
+        for start in range(0, len(df), chunksize):
+            chunk = df.iloc[start:start + chunksize]
+            arrow_buf = self._arrow_csv(chunk)
+            if arrow_buf is not None:
+                cur.copy_expert(sql=arrow_sql, file=arrow_buf)
+                continue
+            s_buf.seek(0)
+            s_buf.truncate()
+            chunk.to_csv(s_buf, header=False, index=False, na_rep='\\N', lineterminator='\n')
+            s_buf.seek(0)
+            cur.copy_expert(sql=pandas_sql, file=s_buf)
+
+    def _copy_path(self, df: pd.DataFrame, table_name: str, chunksize: int = 50000) -> None:
+        """
+        Inserts a DataFrame into a PostgreSQL table with CSV COPY in a single transaction,
+        creating the table from the DataFrame schema if it does not exist yet.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the PostgreSQL database.
+            chunksize (int): Number of rows sent per COPY. Defaults to 50,000.
+        """
+        self._ensure_table(df, table_name)
+        with self.db_handler.engine.begin() as conn:
+            with conn.connection.cursor() as cur:
+                self._copy_df(cur, df, table_name, chunksize=chunksize)
+
+    def insert_df_arrow(self, df: pd.DataFrame, table_name: str) -> None:
+        """
+        Inserts a Pandas DataFrame into a PostgreSQL table through ADBC and Apache Arrow.
+
+        The DataFrame is converted to an Arrow table and ingested with the ADBC PostgreSQL
+        driver, which streams it to COPY in C without building Python row objects. The table
+        is created from the Arrow schema if it does not exist yet.
+
+        ADBC sends binary COPY using the Arrow types, so the DataFrame's dtypes must match the
+        column types of an existing table exactly (e.g. int64 only loads into `bigint` columns,
+        not `integer`), and object columns must be convertible by `pa.Table.from_pandas`.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the PostgreSQL database.
+
+        Raises:
+            ImportError: If `pyarrow` or `adbc-driver-postgresql` is not installed.
+            Exception: If the DataFrame insertion fails due to database connectivity or query issues.
+        """
+        if pa is None or adbc_dbapi is None:
+            raise ImportError("insert_df_arrow requires the 'pyarrow' and 'adbc-driver-postgresql' packages.")
+        uri = self.db_handler.engine.url.set(drivername='postgresql').render_as_string(hide_password=False)
+        with adbc_dbapi.connect(uri) as conn:
+            with conn.cursor() as cur:
+                cur.adbc_ingest(table_name, pa.Table.from_pandas(df, preserve_index=False), mode='create_append')
+            conn.commit()
+
+    def _insert_chunk(self, df: pd.DataFrame, table_name: str, chunksize: int = 50000) -> None:
+        """
+        Inserts a DataFrame into a PostgreSQL table using ADBC or binary COPY if requested,
+        otherwise CSV COPY.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be inserted.
+            table_name (str): The name of the target table in the PostgreSQL database.
+            chunksize (int): Number of rows sent per COPY. Defaults to 50,000.
+        """
+        if self.use_adbc:
+            # Ingest the DataFrame through Arrow with the optional ADBC driver
+            self.insert_df_arrow(df, table_name)
+        elif self.use_binary_copy:
+            # Insert the DataFrame to PostgreSQL using the session handler and the binary COPY method
+            df.to_sql(name=table_name, con=self.db_handler.engine, if_exists='append', index=False,
+                      method=self.psql_insert_copy_binary, chunksize=chunksize)
+        else:
+            self._copy_path(df, table_name, chunksize=chunksize)
+
+    def insert_df(self, df: pd.DataFrame, table_name: str, chunksize: int = 50000,
+                  copy_threshold: int = 5000) -> None:
         """
         Inserts a Pandas DataFrame into a PostgreSQL database table.
 
+        Small DataFrames (fewer than `copy_threshold` cells, i.e. rows x columns) are sent as
+        multi-row INSERT statements, which avoid the setup cost of COPY. Larger ones are loaded
+        with COPY, or delegated to `insert_df_arrow` when the inserter was created with `use_adbc=True`.
+
         Args:
             df (pd.DataFrame): The DataFrame to be inserted.
             table_name (str): The name of the target table in the PostgreSQL database.
+            chunksize (int): Number of rows sent per COPY, bounding client-side memory. Defaults to 50,000.
+            copy_threshold (int): Number of cells from which COPY is used instead of multi-row
+                INSERT. Defaults to 5,000; pass 0 to always use COPY.
 
         Raises:
             Exception: If the DataFrame insertion fails due to database connectivity or query issues.
         """
         try:
-            # Insert the DataFrame to PostgreSQL using the session handler and the COPY method
-            df.to_sql(name=table_name, con=self.db_handler.engine, if_exists='append', index=False, method=self.psql_insert_copy)
+            columns = max(1, len(df.columns))
+            if len(df) * columns < copy_threshold:
+                # Multi-row INSERTs are cheaper than COPY for small DataFrames
+                df.to_sql(name=table_name, con=self.db_handler.engine, if_exists='append', index=False,
+                          method='multi', chunksize=max(1, copy_threshold // columns))
+            else:
+                self._insert_chunk(df, table_name, chunksize=chunksize)
             print(f"Data successfully inserted into {table_name}")
         except Exception as e:
             # Handle any exceptions that occur during the insertion process
             print(f"Failed to insert data: {e}")
-        finally:
-            # Close the PostgreSQL connection
-            self.db_handler.close_connection()
+
+    def insert_many(self, frames: dict[str, pd.DataFrame], chunksize: int = 50000) -> None:
+        """
+        Inserts several DataFrames into their PostgreSQL tables with COPY in a single
+        transaction, so all of the rows are committed (or rolled back) together.
+
+        Missing tables are created beforehand in their own transactions, so they are kept
+        even if the load is rolled back. ADBC ingestion runs on its own connections and
+        cannot join the transaction, so `use_adbc` is ignored here and the frames are
+        loaded with COPY (binary COPY when `use_binary_copy` is set).
+
+        Args:
+            frames (dict[str, pd.DataFrame]): Mapping of target table names to the DataFrames to insert.
+            chunksize (int): Number of rows sent per COPY. Defaults to 50,000.
+
+        Raises:
+            Exception: If the DataFrame insertion fails due to database connectivity or query issues.
+        """
+        try:
+            for table_name, df in frames.items():
+                self._ensure_table(df, table_name)
+
+            with self.db_handler.engine.begin() as conn:
+                for table_name, df in frames.items():
+                    if self.use_binary_copy:
+                        df.to_sql(name=table_name, con=conn, if_exists='append', index=False,
+                                  method=self.psql_insert_copy_binary, chunksize=chunksize)
+                    else:
+                        with conn.connection.cursor() as cur:
+                            self._copy_df(cur, df, table_name, chunksize=chunksize)
+            print(f"Data successfully inserted into {', '.join(frames)}")
+        except Exception as e:
+            # Handle any exceptions that occur during the insertion process
+            print(f"Failed to insert data: {e}")
 
 
 # Usage Example (to be removed when packaging):
@@ -1,10 +1,49 @@
+import itertools
+import threading
+from contextlib import contextmanager
 import sqlalchemy
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 # from clickhouse_sqlalchemy import make_session
 # import boto3
 import warnings
-warnings.filterwarnings("ignore")
+# Only silence SQLAlchemy's own warnings, so warnings raised by this package still reach callers
+warnings.filterwarnings("ignore", category=sqlalchemy.exc.SAWarning)
+
+BATCH_SIZE = 10000
+LARGE_RESULT_ROWS = 1000000
+
+# Engines shared by every handler connecting to the same URL, so new handlers reuse a warm pool
+_ENGINE_CACHE: dict[str, sqlalchemy.engine.Engine] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+
+def get_engine(url: str, **kwargs) -> sqlalchemy.engine.Engine:
+    """
+    Returns the cached engine for a connection URL, creating it on first use.
+
+    Args:
+        url (str): The database connection URL.
+        kwargs: Options passed to `create_engine` when the engine is first created.
+
+    Returns:
+        Engine: The SQLAlchemy engine for the URL.
+    """
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.get(url)
+        if engine is None:
+            engine = _ENGINE_CACHE[url] = create_engine(url, **kwargs)
+        return engine
+
+
+def dispose_engines() -> None:
+    """
+    Disposes of every cached engine, closing their pooled connections, and clears the cache.
+    """
+    with _ENGINE_CACHE_LOCK:
+        for engine in _ENGINE_CACHE.values():
+            engine.dispose()
+        _ENGINE_CACHE.clear()
 
 class BaseDatabaseHandler:
     """
@@ -47,12 +86,46 @@ class BaseDatabaseHandler:
         """
         raise NotImplementedError("Subclasses must implement this method")
 
-    def execute_query(self, query: str) -> tuple:
+    @contextmanager
+    def session_scope(self, session=None):
+        """
+        Provides a transactional scope around a series of operations.
+
+        The session is committed when the block exits normally and rolled back if it
+        raises. Wrap several `execute_query`/`batch_update` calls in one scope and pass
+        the yielded session to them to share a single transaction:
+
+            with handler.session_scope() as session:
+                handler.execute_query(query, session=session)
+                handler.batch_update(update_sql, data, session=session)
+
+        Args:
+            session: An already open session. When given it is yielded as-is and the
+                enclosing scope remains responsible for committing it.
+
+        Yields:
+            Session: The SQLAlchemy session to execute statements on.
+        """
+        if session is not None:
+            yield session
+            return
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def execute_query(self, query: str, session=None) -> tuple:
         """
         Executes a SQL query and returns the results.
 
         Args:
             query (str): The SQL query to be executed.
+            session: Optional session from `session_scope` to run the query in.
 
         Returns:
             tuple: A tuple containing the query results and column keys. 
@@ -61,47 +134,75 @@ class BaseDatabaseHandler:
         Raises:
             Exception: If query execution fails.
         """
-        session = self.Session()
-        try:
+        with self.session_scope(session) as session:
             result = session.execute(text(query))
-            session.commit()
             if result.returns_rows:
-                return result.fetchall(), result.keys()
+                rows = result.fetchall()
+                if len(rows) > LARGE_RESULT_ROWS:
+                    warnings.warn(
+                        f"execute_query loaded {len(rows)} rows into memory; use execute_query_stream "
+                        "for large result sets.",
+                        UserWarning,
+                        stacklevel=2,
+                    )
+                return rows, result.keys()
             else:
                 return None, None
-        except Exception as e:
-            session.rollback()
-            raise
-        finally:
-            session.close()
 
-    def batch_update(self, update_sql: str, data: list[dict]) -> None:
+    def execute_query_stream(self, query: str, chunksize: int = 10000):
         """
-        Performs a batch update using the provided SQL and data.
+        Executes a SQL query and yields the results in chunks using a server-side cursor,
+        so memory stays bounded regardless of the result size.
+
+        Args:
+            query (str): The SQL query to be executed.
+            chunksize (int): Maximum number of rows per yielded chunk. Defaults to 10,000.
+
+        Yields:
+            tuple: A tuple containing a list of up to `chunksize` rows and the column keys.
+
+        Raises:
+            Exception: If query execution fails.
+        """
+        with self.engine.connect().execution_options(stream_results=True) as conn:
+            result = conn.execute(text(query))
+            keys = result.keys()
+            while rows := result.fetchmany(chunksize):
+                yield rows, keys
+
+    def batch_update(self, update_sql: str, data: list[dict], session=None) -> None:
+        """
+        Performs a batch update using the provided SQL and data. The parameters are
+        sent with executemany in batches of `BATCH_SIZE` rows.
 
         Args:
             update_sql (str): The SQL update statement.
             data (list[dict]): A list of dictionaries containing the update parameters.
+            session: Optional session from `session_scope` to run the update in.
 
         Raises:
             Exception: If batch update fails.
         """
-        session = self.Session()
-        try:
-            for params in data:
-                session.execute(text(update_sql), params)
-            session.commit()
-        except Exception as e:
-            session.rollback()
-            raise
-        finally:
-            session.close()
+        with self.session_scope(session) as session:
+            # Send the parameters as executemany batches rather than one statement per row
+            statement = text(update_sql)
+            rows = iter(data)
+            while batch := list(itertools.islice(rows, BATCH_SIZE)):
+                session.execute(statement, batch)
 
     def close_connection(self) -> None:
         """
-        Closes the connection to the database by disposing of the engine.
+        Releases the handler's use of the database engine.
+
+        Engines from `get_engine` are cached and shared between handlers, so their connection
+        pools are left open; use `dispose_engines` to close them. Engines created outside the
+        cache are disposed of here.
         """
-        self.engine.dispose()
+        engine = getattr(self, 'engine', None)
+        with _ENGINE_CACHE_LOCK:
+            cached = any(engine is cached_engine for cached_engine in _ENGINE_CACHE.values())
+        if engine is not None and not cached:
+            engine.dispose()
 
 class SQLDatabaseHandler(BaseDatabaseHandler):
     """
@@ -133,7 +234,8 @@ class SQLDatabaseHandler(BaseDatabaseHandler):
             kwargs: Connection parameters such as user, password, host, port, and database.
         """
         url = self.build_url(**kwargs)
-        self.engine = create_engine(url)
+        # local_infile is required by LOAD DATA LOCAL INFILE in MySQLDatabaseInserter
+        self.engine = get_engine(url, pool_size=5, pool_pre_ping=True, connect_args={"local_infile": 1})
         self.Session = sessionmaker(bind=self.engine)
 
 class PostgreSQLDatabaseHandler(BaseDatabaseHandler):
@@ -146,7 +248,8 @@ class PostgreSQLDatabaseHandler(BaseDatabaseHandler):
         Builds the PostgreSQL database connection URL.
 
         Args:
-            kwargs: Connection parameters such as user, password, host, port, and database.
+            kwargs: Connection parameters such as user, password, host, port, and database,
+                plus an optional driver ('psycopg2' by default, or 'psycopg' for psycopg3).
 
         Returns:
             str: The connection URL for the PostgreSQL database.
@@ -156,17 +259,27 @@ class PostgreSQLDatabaseHandler(BaseDatabaseHandler):
         host = kwargs.get('host')
         port = kwargs.get('port', '5432')
         database = kwargs.get('database', '')
-        return f"postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}" if database else f"postgresql+psycopg2://{user}:{password}@{host}:{port}"
+        driver = kwargs.get('driver', 'psycopg2')
+        return f"postgresql+{driver}://{user}:{password}@{host}:{port}/{database}" if database else f"postgresql+{driver}://{user}:{password}@{host}:{port}"
 
     def setup(self, **kwargs) -> None:
         """
         Sets up the PostgreSQL database engine and session.
 
         Args:
-            kwargs: Connection parameters such as user, password, host, port, and database.
+            kwargs: Connection parameters such as user, password, host, port, database, and driver.
         """
         url = self.build_url(**kwargs)
-        self.engine = create_engine(url)
+        engine_options = {}
+        if kwargs.get('driver', 'psycopg2') == 'psycopg2':
+            # Use psycopg2's fast execution helpers so executemany batches rows instead of
+            # sending one statement per parameter set
+            engine_options = dict(
+                executemany_mode="values_plus_batch",
+                insertmanyvalues_page_size=10000,
+                executemany_batch_page_size=500,
+            )
+        self.engine = get_engine(url, pool_size=5, pool_pre_ping=True, **engine_options)
         self.Session = sessionmaker(bind=self.engine)
 
 class ClickhouseDatabaseHandler(BaseDatabaseHandler):
@@ -199,7 +312,7 @@ class ClickhouseDatabaseHandler(BaseDatabaseHandler):
         """
         url = self.build_url(**kwargs)
         print(url)
-        self.engine = create_engine(url)
+        self.engine = get_engine(url)
 
     def execute_query(self, query: str) -> tuple:
         """
@@ -242,8 +355,11 @@ class ClickhouseDatabaseHandler(BaseDatabaseHandler):
         """
         session = make_session(self.engine)
         try:
-            for params in data:
-                session.execute(text(update_sql), params)
+            # Send the parameters as executemany batches rather than one statement per row
+            statement = text(update_sql)
+            rows = iter(data)
+            while batch := list(itertools.islice(rows, BATCH_SIZE)):
+                session.execute(statement, batch)
             session.commit()
         except Exception as e:
             session.rollback()